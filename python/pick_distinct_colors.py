@@ -5,57 +5,236 @@ This module provides various optimization algorithms for selecting a subset of c
 that maximizes the minimum distance between them in the CIELAB color space.
 """
 
+import json
 import math
 import random
+import re
 import time
-from itertools import combinations
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+from operator import index
 from typing import List, Tuple, Dict, Any, Optional
 
 __version__ = '0.2.2'
 
 
-def rgb_to_lab(rgb: Tuple[int, int, int]) -> Tuple[float, float, float]:
-    """Convert RGB color to CIELAB color space."""
-    r, g, b = rgb[0] / 255, rgb[1] / 255, rgb[2] / 255
-    
-    # Gamma correction
-    r = ((r + 0.055) / 1.055) ** 2.4 if r > 0.04045 else r / 12.92
-    g = ((g + 0.055) / 1.055) ** 2.4 if g > 0.04045 else g / 12.92
-    b = ((b + 0.055) / 1.055) ** 2.4 if b > 0.04045 else b / 12.92
-    
-    # Convert to XYZ
-    x = (r * 0.4124 + g * 0.3576 + b * 0.1805) * 100
-    y = (r * 0.2126 + g * 0.7152 + b * 0.0722) * 100
-    z = (r * 0.0193 + g * 0.1192 + b * 0.9505) * 100
-    
-    # Normalize by illuminant D65
-    x /= 95.047
-    y /= 100
-    z /= 108.883
-    
-    # Convert to LAB
-    x = x ** (1/3) if x > 0.008856 else (7.787 * x) + 16/116
-    y = y ** (1/3) if y > 0.008856 else (7.787 * y) + 16/116
-    z = z ** (1/3) if z > 0.008856 else (7.787 * z) + 16/116
-    
-    L = (116 * y) - 16
-    a = 500 * (x - y)
-    b = 200 * (y - z)
+def _srgb_to_linear(c: float) -> float:
+    """Undo the sRGB gamma curve for a channel value in [0, 1]."""
+    return ((c + 0.055) / 1.055) ** 2.4 if c > 0.04045 else c / 12.92
+
+
+# Gamma correction for every 8-bit channel value, so rgb_to_lab needs no pow()
+_SRGB_TO_LINEAR = {value: _srgb_to_linear(value / 255) for value in range(256)}
+
+
+# sRGB -> XYZ matrix (D65), with the scale to 0..100 and the division by the
+# D65 white point (95.047, 100, 108.883) folded into the coefficients
+_RGB_TO_XYZ_NORMALIZED = (
+    (0.4124 * 100 / 95.047, 0.3576 * 100 / 95.047, 0.1805 * 100 / 95.047),
+    (0.2126, 0.7152, 0.0722),
+    (0.0193 * 100 / 108.883, 0.1192 * 100 / 108.883, 0.9505 * 100 / 108.883),
+)
+# CIE f(t): cube root above epsilon, linear segment below it
+_LAB_EPSILON = 0.008856
+_LAB_SLOPE = 7.787
+_LAB_OFFSET = 16 / 116
+
+
+def rgb_to_lab_batch(colors: List[Tuple[int, int, int]]) -> List[Tuple[float, float, float]]:
+    """
+    Convert a list of RGB colors to CIELAB color space.
+
+    Converting a whole palette in one loop avoids a function call per color.
+    """
+    (xr, xg, xb), (yr, yg, yb), (zr, zg, zb) = _RGB_TO_XYZ_NORMALIZED
+    epsilon, slope, offset = _LAB_EPSILON, _LAB_SLOPE, _LAB_OFFSET
+    linear = _SRGB_TO_LINEAR
+    third = 1 / 3
+    
+    lab_colors = []
+    for rgb in colors:
+        # Gamma correction (table lookup for 8-bit channels, formula otherwise)
+        try:
+            r, g, b = linear[rgb[0]], linear[rgb[1]], linear[rgb[2]]
+        except KeyError:
+            r, g, b = _srgb_to_linear(rgb[0] / 255), _srgb_to_linear(rgb[1] / 255), _srgb_to_linear(rgb[2] / 255)
+        
+        # Convert to XYZ, normalized by illuminant D65
+        x = r * xr + g * xg + b * xb
+        y = r * yr + g * yg + b * yb
+        z = r * zr + g * zg + b * zb
+        
+        # Convert to LAB
+        x = x ** third if x > epsilon else slope * x + offset
+        y = y ** third if y > epsilon else slope * y + offset
+        z = z ** third if z > epsilon else slope * z + offset
+        
+        lab_colors.append(((116 * y) - 16, 500 * (x - y), 200 * (y - z)))
     
-    return L, a, b
+    return lab_colors
+
+
+@lru_cache(maxsize=1 << 16)
+def _cached_rgb_to_lab(rgb: Tuple[int, int, int]) -> Tuple[float, float, float]:
+    return rgb_to_lab_batch((rgb,))[0]
+
+
+def rgb_to_lab(rgb: Tuple[int, int, int]) -> Tuple[float, float, float]:
+    """
+    Convert RGB color to CIELAB color space.
+
+    Results are memoized per color, so converting the same colors again (for
+    example when comparing several algorithms) is a dictionary lookup.
+    """
+    return _cached_rgb_to_lab(tuple(rgb))
 
 
-def delta_e(lab_a: Tuple[float, float, float], lab_b: Tuple[float, float, float]) -> float:
+def delta_e(lab_a: Tuple[float, float, float], lab_b: Tuple[float, float, float],
+            _sqrt=math.sqrt) -> float:
     """Calculate CIE76 Delta E distance between two LAB colors."""
+    # Squares as products: float ** 2 goes through the generic power routine
     delta_L = lab_a[0] - lab_b[0]
     delta_a = lab_a[1] - lab_b[1]
     delta_b = lab_a[2] - lab_b[2]
-    return math.sqrt(delta_L ** 2 + delta_a ** 2 + delta_b ** 2)
+    return _sqrt(delta_L * delta_L + delta_a * delta_a + delta_b * delta_b)
+
+
+def delta_e_squared(lab_a: Tuple[float, float, float], lab_b: Tuple[float, float, float]) -> float:
+    """
+    Calculate the squared CIE76 Delta E distance between two LAB colors.
+
+    The square root is monotonic, so squared distances order colors exactly like
+    delta_e does. Use this when distances are only compared, never reported.
+    """
+    delta_L = lab_a[0] - lab_b[0]
+    delta_a = lab_a[1] - lab_b[1]
+    delta_b = lab_a[2] - lab_b[2]
+    return delta_L * delta_L + delta_a * delta_a + delta_b * delta_b
+
+
+def distance_matrix(lab_colors: List[Tuple[float, float, float]],
+                    squared: bool = False) -> List[List[float]]:
+    """
+    Calculate the symmetric matrix of CIE76 Delta E distances between LAB colors.
+
+    Each pair is computed once and mirrored; the diagonal is zero. Distances are
+    produced a row at a time by one comprehension over the remaining colors,
+    which avoids a delta_e function call per pair. With squared=True the matrix
+    holds squared distances (no square roots), which rank pairs identically.
+    """
+    count = len(lab_colors)
+    matrix = [[0.0] * count for _ in range(count)]
+    for i in range(count - 1):
+        L1, a1, b1 = lab_colors[i]
+        row = [(L1 - L2) * (L1 - L2) + (a1 - a2) * (a1 - a2) + (b1 - b2) * (b1 - b2)
+               for L2, a2, b2 in lab_colors[i + 1:]]
+        if not squared:
+            row = list(map(math.sqrt, row))
+        matrix[i][i + 1:] = row
+        for j, distance in enumerate(row, i + 1):
+            matrix[j][i] = distance
+    return matrix
+
+
+def _normalize_colors(colors) -> List[Tuple[int, int, int]]:
+    """
+    Convert any sequence of RGB triples (tuples, lists, ...) to a list of int tuples.
+
+    Raises ValueError for a color that is not exactly three integer channels,
+    such as RGBA or float values.
+
+    """
+    try:
+        return [(index(r), index(g), index(b)) for r, g, b in colors]
+    except (TypeError, ValueError):
+        raise ValueError("Colors must be (r, g, b) triples of integers")
+
+
+@lru_cache(maxsize=32)
+def _cached_palette_to_lab(palette: Tuple[Tuple[int, int, int], ...]) -> Tuple[Tuple[float, float, float], ...]:
+    return tuple(rgb_to_lab_batch(palette))
+
+
+def _palette_to_lab(colors) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Convert a palette to LAB, reusing the result when the same palette is seen again.
+
+    Comparing algorithms on one palette (or re-running with the same seed) would
+    otherwise repeat the full RGB -> LAB conversion on every call.
+    """
+    return _cached_palette_to_lab(tuple(map(tuple, colors)))
+
+
+# A distance matrix holds len(palette)**2 boxed floats (about 8 MB at 500
+# colors), so only palettes up to this size keep theirs in the cache
+_MAX_CACHED_PALETTE_SIZE = 500
+
+
+def _build_palette_distances(palette: Tuple[Tuple[int, int, int], ...],
+                             squared: bool) -> Tuple[Tuple[float, ...], ...]:
+    return tuple(map(tuple, distance_matrix(_cached_palette_to_lab(palette), squared=squared)))
+
+
+_cached_palette_distances = lru_cache(maxsize=8)(_build_palette_distances)
+
+
+def _palette_distances(colors, squared: bool = False) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Return the pairwise Delta E matrix of a palette, reusing it for repeated palettes.
+
+    Algorithms that score many subsets of the same pool look distances up here
+    instead of recomputing them for every candidate. Algorithms that only
+    compare minimum distances ask for the squared matrix, which skips the
+    square roots. Each call builds and caches only the matrix it asked for.
+    Palettes larger than _MAX_CACHED_PALETTE_SIZE are not cached, so a
+    long-running process does not keep several very large matrices alive.
+    """
+    palette = tuple(map(tuple, colors))
+    if len(palette) > _MAX_CACHED_PALETTE_SIZE:
+        return _build_palette_distances(palette, squared)
+    return _cached_palette_distances(palette, squared)
+
+
+class _LazyDistanceRow(dict):
+    """
+    One row of a palette's Delta E matrix, filled in as entries are read.
+
+    A list of these stands in for the full matrix where a search only ever
+    reads the distances between a few selected colors: on a large palette it
+    avoids building len(palette)**2 distances for a handful of lookups.
+    """
+
+    def __init__(self, lab_colors, lab, distance=delta_e):
+        super().__init__()
+        self.lab_colors = lab_colors
+        self.lab = lab
+        self.distance = distance
+
+    def __missing__(self, index: int) -> float:
+        distance = self[index] = self.distance(self.lab, self.lab_colors[index])
+        return distance
+
+
+def _selection_distances(colors, squared: bool = False):
+    """
+    Distances for searches that only read pairs within small selections.
+
+    Palettes up to _MAX_CACHED_PALETTE_SIZE get the cached full matrix; larger
+    ones get _LazyDistanceRow rows, which compute each entry from the cached
+    LAB colors on first access. Either is indexed as distances[i][j].
+    """
+    if len(colors) <= _MAX_CACHED_PALETTE_SIZE:
+        return _palette_distances(colors, squared)
+    lab_colors = _palette_to_lab(colors)
+    distance = delta_e_squared if squared else delta_e
+    return [_LazyDistanceRow(lab_colors, lab, distance) for lab in lab_colors]
 
 
 def sort_colors(colors: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
     """Sort colors by LAB values (L, then a, then b)."""
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
+    lab_colors = rgb_to_lab_batch(colors)
     indices = list(range(len(colors)))
     
     # Sort by L (descending), then a (descending), then b (descending)
@@ -64,24 +243,65 @@ def sort_colors(colors: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]
     return [colors[i] for i in indices]
 
 
-def calculate_metrics(colors: List[Tuple[int, int, int]]) -> Dict[str, float]:
-    """Calculate distance metrics for a set of colors."""
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
-    distances = []
+def _sort_selection(colors: List[Tuple[int, int, int]], indices: List[int],
+                    lab_colors) -> List[Tuple[int, int, int]]:
+    """
+    Return colors[i] for the given indices in sort_colors order.
+
+    For algorithms that already hold the LAB form of the palette, so the
+    selected colors are not converted again just to be sorted.
+    """
+    order = sorted(indices, key=lambda i: (-lab_colors[i][0], -lab_colors[i][1], -lab_colors[i][2]))
+    return [colors[i] for i in order]
+
+
+def _selection_result(colors: List[Tuple[int, int, int]], indices: List[int],
+                      settings: Optional[Dict[str, Any]], start_time: float,
+                      lab_colors=None) -> Dict[str, Any]:
+    """
+    Build an algorithm's result: the selected colors and the run time in ms.
+
+    The colors are returned in sort_colors order unless settings['sort'] is
+    False, which skips the sort for callers that only need the set (e.g. when
+    running an algorithm many times). lab_colors, if the algorithm holds the
+    palette in LAB, is reused for sorting.
+    """
+    if settings is not None and not settings.get('sort', True):
+        selected_colors = [colors[i] for i in indices]
+    elif lab_colors is not None:
+        selected_colors = _sort_selection(colors, indices, lab_colors)
+    else:
+        selected_colors = sort_colors([colors[i] for i in indices])
+    return {
+        'colors': selected_colors,
+        'time': (time.time() - start_time) * 1000
+    }
+
+
+def calculate_metrics(colors: List[Tuple[int, int, int]],
+                      matrix: Optional[List[List[float]]] = None) -> Dict[str, float]:
+    """
+    Calculate distance metrics for a set of colors.
+
+    If the Delta E matrix of the colors is already at hand (see
+    distance_matrix), pass it as matrix to skip the LAB conversion and
+    distance computation.
+    """
+    if matrix is None:
+        matrix = distance_matrix(rgb_to_lab_batch(colors))
     
-    for i in range(len(colors) - 1):
-        for j in range(i + 1, len(colors)):
-            dist = delta_e(lab_colors[i], lab_colors[j])
-            distances.append(dist)
+    # Upper triangle of the matrix as one flat batch; the reductions below run in C
+    distances = [distance for i, row in enumerate(matrix, 1) for distance in row[i:]]
     
     if not distances:
         return {'min': 0, 'max': 0, 'avg': 0, 'sum': 0}
     
+    total = sum(distances)
     return {
         'min': min(distances),
         'max': max(distances),
-        'avg': sum(distances) / len(distances),
-        'sum': sum(distances)
+        'avg': total / len(distances),
+        'sum': total
     }
 
 
@@ -95,6 +315,13 @@ def generate_random_colors(count: int) -> List[Tuple[int, int, int]]:
     return [random_color() for _ in range(count)]
 
 
+def _random_color_pool(count: int, prng=random) -> List[Tuple[int, int, int]]:
+    """Generate random RGB colors, drawing all three channels from one 24-bit sample."""
+    getrandbits = prng.getrandbits
+    return [(bits >> 16, (bits >> 8) & 0xFF, bits & 0xFF)
+            for bits in [getrandbits(24) for _ in range(count)]]
+
+
 def generate_color_palette(total_colors: int = 30, 
                           custom_colors: Optional[List[Tuple[int, int, int]]] = None,
                           mode: str = 'replace') -> List[Tuple[int, int, int]]:
@@ -163,6 +390,24 @@ def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
     return '#' + ''.join(f'{c:02x}' for c in rgb)
 
 
+# One color channel, in any form int() accepts: optional sign, digits with
+# single underscores between them
+_CHANNEL = r'([+-]?\d+(?:_\d+)*)'
+# Whitespace other than a plain space, allowed around space-separated channels
+_NON_SPACE_WS = r'[^\S ]*'
+
+# All single-color formats in one pattern. Each alternative ends with a named
+# (marker) group, so match.lastgroup tells which format matched
+_COLOR_STRING_RE = re.compile(
+    r'#*(?P<hex>[0-9a-fA-F]{6})'
+    r'|rgb\(\s*' + _CHANNEL + r'\s*,\s*' + _CHANNEL + r'\s*,\s*' + _CHANNEL + r'\s*(?P<rgb>)\)'
+    r'|' + _CHANNEL + r'\s*,\s*' + _CHANNEL + r'\s*,\s*' + _CHANNEL + r'(?P<csv>)'
+    r'|' + _CHANNEL + _NON_SPACE_WS + ' ' + _NON_SPACE_WS + _CHANNEL
+    + _NON_SPACE_WS + ' ' + _NON_SPACE_WS + _CHANNEL + r'(?P<ssv>)',
+    re.IGNORECASE
+)
+
+
 def parse_color_string(color_str: str) -> Tuple[int, int, int]:
     """
     Parse a color string in various formats to RGB tuple.
@@ -172,39 +417,34 @@ def parse_color_string(color_str: str) -> Tuple[int, int, int]:
     - RGB function: rgb(r,g,b) or RGB(r,g,b)
     - Comma-separated: r,g,b
     - Space-separated: r g b
+    
+    Channels are integers from 0 to 255 written as int() accepts them, so a
+    sign or underscores ('+1', '-0', '1_0') are allowed.
     """
     color_str = color_str.strip()
-    
-    # Hex format
-    if color_str.startswith('#') or (len(color_str) == 6 and all(c in '0123456789abcdefABCDEF' for c in color_str)):
-        return hex_to_rgb(color_str)
-    
-    # RGB function format
-    if color_str.lower().startswith('rgb(') and color_str.endswith(')'):
-        rgb_values = color_str[4:-1].split(',')
-        if len(rgb_values) == 3:
-            try:
-                rgb_tuple = tuple(int(v.strip()) for v in rgb_values)
-                if all(0 <= c <= 255 for c in rgb_tuple):
-                    return rgb_tuple
-            except ValueError:
-                pass
-    
-    # Comma or space separated
-    for separator in [',', ' ']:
-        if separator in color_str:
-            rgb_values = color_str.split(separator)
-            if len(rgb_values) == 3:
-                try:
-                    rgb_tuple = tuple(int(v.strip()) for v in rgb_values)
-                    if all(0 <= c <= 255 for c in rgb_tuple):
-                        return rgb_tuple
-                except ValueError:
-                    pass
+    match = _COLOR_STRING_RE.fullmatch(color_str)
+    
+    if match is None:
+        if color_str.startswith('#'):
+            return hex_to_rgb(color_str)  # Raises with the hex-specific message
+    elif match.lastgroup == 'hex':
+        value = int(match.group('hex'), 16)
+        return (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+    else:
+        # rgb(r,g,b), comma or space separated: the three numbers are the
+        # groups just before the matched alternative's marker group
+        last = match.lastindex
+        r, g, b = int(match[last - 3]), int(match[last - 2]), int(match[last - 1])
+        if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
+            return (r, g, b)
     
     raise ValueError(f"Could not parse color string: {color_str}")
 
 
+# One [r, g, b] item of a JavaScript-style array that is not valid JSON
+_RGB_ARRAY_ITEM_RE = re.compile(r'\[(\d+),\s*(\d+),\s*(\d+)\]')
+
+
 def parse_color_list(color_text: str) -> List[Tuple[int, int, int]]:
     """
     Parse a text containing multiple colors in various formats.
@@ -220,14 +460,11 @@ def parse_color_list(color_text: str) -> List[Tuple[int, int, int]]:
     # Try to parse as JSON/JavaScript array first
     if color_text.startswith('[') and color_text.endswith(']'):
         try:
-            import json
             # Try parsing as JSON
             parsed = json.loads(color_text)
             if isinstance(parsed, list):
-                for item in parsed:
-                    if isinstance(item, list) and len(item) == 3:
-                        colors.append(tuple(int(v) for v in item))
-                return colors
+                return [(int(item[0]), int(item[1]), int(item[2])) for item in parsed
+                        if isinstance(item, list) and len(item) == 3]
         except (json.JSONDecodeError, ValueError):
             pass
         
@@ -236,10 +473,8 @@ def parse_color_list(color_text: str) -> List[Tuple[int, int, int]]:
             # Remove brackets and split by arrays
             inner = color_text[1:-1]
             # Simple parsing for [[r,g,b], [r,g,b]] format
-            import re
-            matches = re.findall(r'\[(\d+),\s*(\d+),\s*(\d+)\]', inner)
-            for match in matches:
-                colors.append(tuple(int(v) for v in match))
+            matches = _RGB_ARRAY_ITEM_RE.findall(inner)
+            colors = [(int(r), int(g), int(b)) for r, g, b in matches]
             if colors:
                 return colors
         except:
@@ -268,63 +503,61 @@ def greedy_selection(colors: List[Tuple[int, int, int]], select_count: int, sett
         settings = {}
     prng = random.Random(settings["seed"]) if "seed" in settings else random
     start_time = time.time()
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
-    selected = []
-    available = list(range(len(colors)))
-    
-    def calculate_min_distance(index: int) -> float:
-        if not selected:
-            return float('inf')
-        return min(delta_e(lab_colors[index], lab_colors[sel_idx]) for sel_idx in selected)
+    lab_colors = _palette_to_lab(colors)
     
     # Select first color randomly
-    first_idx = prng.randint(0, len(available) - 1)
-    selected.append(available.pop(first_idx))
+    last_idx = prng.randint(0, len(colors) - 1)
+    selected = [last_idx]
+    
+    # Squared distance from every color to its nearest selected color. Distances
+    # are only compared here, so the square root is skipped. Selected colors are
+    # marked with -1 so they can never win the argmax below.
+    min_distances = [float('inf')] * len(colors)
     
-    # Select remaining colors
+    # Select remaining colors (farthest-point sampling): only the distances to
+    # the most recently selected color need to be folded in on each step
     while len(selected) < select_count:
-        best_idx = 0
-        best_min_distance = -float('inf')
+        # Inlined delta_e_squared; one comprehension per pick keeps the whole
+        # update out of the interpreter's per-call overhead
+        L1, a1, b1 = lab_colors[last_idx]
+        min_distances = [
+            current if current < distance else distance
+            for current, (L2, a2, b2) in zip(min_distances, lab_colors)
+            for distance in ((L1 - L2) * (L1 - L2) + (a1 - a2) * (a1 - a2) + (b1 - b2) * (b1 - b2),)
+        ]
+        min_distances[last_idx] = -1.0
         
-        for i, idx in enumerate(available):
-            min_distance = calculate_min_distance(idx)
-            if min_distance > best_min_distance:
-                best_min_distance = min_distance
-                best_idx = i
-        
-        selected.append(available.pop(best_idx))
+        # First index of the maximum
+
+        last_idx = min_distances.index(max(min_distances))
+        selected.append(last_idx)
     
-    selected_colors = [colors[i] for i in selected]
-    return {
-        'colors': sort_colors(selected_colors),
-        'time': (time.time() - start_time) * 1000  # Convert to milliseconds
-    }
+    return _selection_result(colors, selected, settings, start_time, lab_colors)
 
 
 def max_sum_distances_global(colors: List[Tuple[int, int, int]], select_count: int,
-                            _settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                            settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Select colors with highest total distances to all other colors.
     """
     start_time = time.time()
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
-    
-    # Calculate total distances from each color to all others
-    total_distances = []
-    for i in range(len(colors)):
-        total_dist = sum(delta_e(lab_colors[i], lab_colors[j]) 
-                        for j in range(len(colors)) if i != j)
-        total_distances.append((i, total_dist))
+    lab_colors = _palette_to_lab(colors)
+    sqrt = math.sqrt
+    
+    # Calculate total distances from each color to all others. Each row is
+    # summed as soon as it is computed, so large pools never hold the full
+    # N x N distance matrix in memory.
+    total_distances = [
+        (i, sum([sqrt((L1 - L2) * (L1 - L2) + (a1 - a2) * (a1 - a2) + (b1 - b2) * (b1 - b2))
+                 for L2, a2, b2 in lab_colors]))
+        for i, (L1, a1, b1) in enumerate(lab_colors)
+    ]
     
     # Sort by total distance (descending) and select top colors
     total_distances.sort(key=lambda x: x[1], reverse=True)
     selected_indices = [idx for idx, _ in total_distances[:select_count]]
-    selected_colors = [colors[i] for i in selected_indices]
     
-    return {
-        'colors': sort_colors(selected_colors),
-        'time': (time.time() - start_time) * 1000
-    }
+    return _selection_result(colors, selected_indices, settings, start_time, lab_colors)
 
 
 def max_sum_distances_sequential(colors: List[Tuple[int, int, int]], select_count: int, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -335,99 +568,274 @@ def max_sum_distances_sequential(colors: List[Tuple[int, int, int]], select_coun
         settings = {}
     prng = random.Random(settings["seed"]) if "seed" in settings else random
     start_time = time.time()
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
-    selected = []
-    available = list(range(len(colors)))
-    
-    def calculate_total_distance(index: int) -> float:
-        return sum(delta_e(lab_colors[index], lab_colors[sel_idx]) for sel_idx in selected)
+    lab_colors = _palette_to_lab(colors)
     
     # Select first color randomly
-    first_idx = prng.randint(0, len(available) - 1)
-    selected.append(available.pop(first_idx))
+    last_idx = prng.randint(0, len(colors) - 1)
+    selected = [last_idx]
+    
+    # Sum of distances from every color to the selected colors. Selected colors
+    # are marked with -inf so they can never win the argmax below.
+    total_distances = [0.0] * len(colors)
     
-    # Select remaining colors
+    # Select remaining colors, folding in only the distances to the newest pick
     while len(selected) < select_count:
-        best_idx = 0
-        best_distance = -float('inf')
+        last_lab = lab_colors[last_idx]
+        total_distances = [total + delta_e(lab, last_lab)
+                           for total, lab in zip(total_distances, lab_colors)]
+        total_distances[last_idx] = -float('inf')
         
-        for i, idx in enumerate(available):
-            total_distance = calculate_total_distance(idx)
-            if total_distance > best_distance:
-                best_distance = total_distance
-                best_idx = i
-        
-        selected.append(available.pop(best_idx))
+        last_idx = total_distances.index(max(total_distances))
+        selected.append(last_idx)
     
-    selected_colors = [colors[i] for i in selected]
-    return {
-        'colors': sort_colors(selected_colors),
-        'time': (time.time() - start_time) * 1000
-    }
+    return _selection_result(colors, selected, settings, start_time, lab_colors)
+
+
+def _random_unselected(prng, count: int, selection) -> Optional[int]:
+    """
+    Draw a random palette index in range(count) that is not in selection.
+
+    Draws uniform indices until one is not in selection (rejection sampling).
+    Returns None when every index is selected.
+
+    """
+    if len(selection) >= count:
+        return None
+    rand = prng.random
+    while True:
+        index = int(rand() * count)
+        if index not in selection:
+            return index
+
+
+def _min_pair_distance(selection, distances) -> float:
+    """
+    Smallest distance between any two colors of a selection of palette indices.
+
+    This is the fitness shared by the search algorithms. The pair distances are
+    gathered from the matrix into one flat list and reduced by min().
+    """
+
+    return min([distances[a][b] for i, a in enumerate(selection, 1) for b in selection[i:]],
+               default=float('inf'))
+
+
+def _min_pair_distance_above(selection, distances, bound: float) -> float:
+    """
+    Minimum pair distance of a selection, short-circuited against a bound.
+
+    As soon as a pair at or below bound is found its distance is returned, since
+    the selection can no longer beat the bound; otherwise the exact minimum is
+    returned. Used where candidates only matter if they improve on a best-so-far.
+    """
+    min_dist = float('inf')
+    for i, a in enumerate(selection, 1):
+        row = distances[a]
+        for b in selection[i:]:
+            dist = row[b]
+            if dist <= bound:
+                return dist
+            if dist < min_dist:
+                min_dist = dist
+    return min_dist
+
+
+def _closest_pair(selection: List[int], distances, skip: int = -1) -> Tuple[float, int, int]:
+    """
+    Find the closest pair in a selection of palette indices.
+
+    Returns the pair's distance and the positions of both colors in the
+    selection; the position given as skip is left out.
+    """
+    closest = (float('inf'), -1, -1)
+    for i in range(len(selection) - 1):
+        if i == skip:
+            continue
+        row = distances[selection[i]]
+        for j in range(i + 1, len(selection)):
+            if j != skip and row[selection[j]] < closest[0]:
+                closest = (row[selection[j]], i, j)
+    return closest
+
+
+def _swap_closest_pair(selection: List[int], distances, closest: Tuple[float, int, int],
+                       swap_index: int, new_index: int) -> Tuple[float, int, int]:
+    """
+    Closest pair after replacing selection[swap_index] with new_index.
+
+    Starting from the closest pair of the unchanged selection, only the
+    distances involving the new color are needed, unless the replaced color
+    was part of that pair (then the rest is rescanned once).
+    """
+    if swap_index == closest[1] or swap_index == closest[2]:
+        closest = _closest_pair(selection, distances, skip=swap_index)
+    row = distances[new_index]
+    for position, color in enumerate(selection):
+        if position != swap_index and row[color] < closest[0]:
+            closest = (row[color], position, swap_index)
+    return closest
+
+
+# Self-tuning Lam schedule for simulated annealing: smoothing factor of the
+# acceptance rate moving average and step size of the temperature correction
+_LAM_RATE_SMOOTHING = 0.02
+_LAM_LEARNING_RATE = 0.1
+# Random moves probed to calibrate the initial temperature, and the default
+# initial temperature (also used when the probe sees no worsening move)
+_INITIAL_TEMP_PROBE_MOVES = 100
+_DEFAULT_INITIAL_TEMP = 1000
+# Worsening moves with delta / T below -_REJECT_EXPONENT are always rejected
+_REJECT_EXPONENT = 20.0
+# Below this acceptance rate of worsening moves the annealing counts as frozen
+_FROZEN_ACCEPTANCE_RATE = 0.02
+
+
+def _lam_target_acceptance(progress: float) -> float:
+    """Lam-Delosme target acceptance rate at a given fraction of the run."""
+    if progress < 0.15:
+        return 0.44 + 0.56 * 560 ** (-progress / 0.15)
+    if progress < 0.65:
+        return 0.44
+    return 0.44 * 440 ** (-(progress - 0.65) / 0.35)
 
 
 def simulated_annealing(colors: List[Tuple[int, int, int]], select_count: int, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Simulated annealing optimization for color selection.
+
+    Two temperature schedules are available through settings['schedule']:
+    - 'self_tuning_lam' (default): adapts the temperature so the observed
+      acceptance rate follows the Lam-Delosme target curve (start high, hold
+      at 44%, then fall to zero). It runs for as many iterations as the
+      geometric schedule would take to cool from initialTemp to minTemp,
+      and never lets the temperature drop below minTemp.
+    - 'geometric': multiply the temperature by coolingRate every iteration
+      and stop once it reaches minTemp.
+
+    With settings['patience'] set, either schedule also stops early once the
+    search is frozen (fewer than 2% of worsening moves are accepted) and the
+    best solution has not improved for that many frozen iterations. This
+    trades some solution quality for time, so it is off by default.
+
+    settings['initialTemp'] defaults to 1000. With initialTemp='auto' the
+    starting temperature is instead calibrated from a probe of random moves so
+    that a worsening move of average size is accepted with probability
+    settings['targetAccept'] (default: 0.98, must lie strictly between 0 and
+    1). A calibrated start is usually cooler, so the run is shorter.
     """
     if settings is None:
         settings = {}
     prng = random.Random(settings["seed"]) if "seed" in settings else random
     start_time = time.time()
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
+    distances = _selection_distances(colors)
     max_iterations = 10000
-    initial_temp = settings.get('initialTemp', 1000)
+    initial_temp = settings.get('initialTemp', _DEFAULT_INITIAL_TEMP)
+    target_accept = settings.get('targetAccept', 0.98)
     cooling_rate = settings.get('coolingRate', 0.995)
     min_temp = settings.get('minTemp', 0.1)
-    
-    def calculate_fitness(selection: List[int]) -> float:
-        min_dist = float('inf')
-        for i in range(len(selection) - 1):
-            for j in range(i + 1, len(selection)):
-                dist = delta_e(lab_colors[selection[i]], lab_colors[selection[j]])
-                min_dist = min(min_dist, dist)
-        return min_dist
+    schedule = settings.get('schedule', 'self_tuning_lam')
+    patience = settings.get('patience')
+    if schedule not in ('self_tuning_lam', 'geometric'):
+        raise ValueError(f"Unknown annealing schedule: {schedule}")
+    if not 0 < target_accept < 1:
+        raise ValueError(f"targetAccept must be between 0 and 1 (exclusive), got {target_accept}")
+    
+    # Bound once; drawn several times per iteration
+    rand = prng.random
+    
+    def random_move(solution: List[int]) -> Tuple[int, int]:
+        # Pick a slot to swap and an unselected color to put into it
+        swap_index = int(rand() * select_count)
+        new_index = _random_unselected(prng, len(colors), solution)
+        if new_index is None:
+            # Every color is selected; the move leaves the solution as it is
+            new_index = solution[swap_index]
+        return swap_index, new_index
     
     # Generate initial solution
     current_solution = prng.sample(range(len(colors)), select_count)
-    current_fitness = calculate_fitness(current_solution)
+    current_closest = _closest_pair(current_solution, distances)
+    current_fitness = current_closest[0]
+    
+    if initial_temp == 'auto':
+        # Probe random moves and solve exp(-mean_worsening / T0) = target_accept
+        worsening = []
+        for _ in range(_INITIAL_TEMP_PROBE_MOVES):
+            swap_index, new_index = random_move(current_solution)
+            delta = _swap_closest_pair(current_solution, distances, current_closest,
+                                       swap_index, new_index)[0] - current_fitness
+            if delta < 0:
+                worsening.append(-delta)
+        if worsening:
+            initial_temp = (sum(worsening) / len(worsening)) / -math.log(target_accept)
+        else:
+            initial_temp = _DEFAULT_INITIAL_TEMP
+    
+    iterations = max_iterations
+    if schedule == 'self_tuning_lam':
+        # Same iteration budget as the geometric schedule for these settings
+        if initial_temp <= min_temp:
+            iterations = 0
+        elif 0 < cooling_rate < 1:
+            iterations = min(max_iterations,
+                             math.ceil(math.log(min_temp / initial_temp) / math.log(cooling_rate)))
+    acceptance_rate = 0.5
     
     best_solution = current_solution[:]
     best_fitness = current_fitness
     
     temperature = initial_temp
+    worsening_acceptance_rate = 1.0
+    iterations_since_improvement = 0
     
     # Main loop
-    for i in range(max_iterations):
-        if temperature <= min_temp:
+    for iteration in range(iterations):
+        if schedule == 'geometric' and temperature <= min_temp:
+            break
+        if patience is not None and iterations_since_improvement >= patience:
             break
             
-        # Generate neighbor by swapping one selected color with an unselected one
-        neighbor_solution = current_solution[:]
-        swap_index = prng.randint(0, select_count - 1)
-        available_indices = [i for i in range(len(colors)) if i not in current_solution]
-        new_index = prng.choice(available_indices)
-        neighbor_solution[swap_index] = new_index
-        
-        neighbor_fitness = calculate_fitness(neighbor_solution)
+        # Evaluate the swap incrementally from the current closest pair; the
+        # solution is only modified (in place) if the move is accepted
+        swap_index, new_index = random_move(current_solution)
+        neighbor_closest = _swap_closest_pair(current_solution, distances, current_closest,
+                                              swap_index, new_index)
+        neighbor_fitness = neighbor_closest[0]
         
-        # Decide if we should accept the neighbor
+        # Decide if we should accept the neighbor. A worsening move is accepted
+        # with probability exp(delta / T), tested in log form as
+        # delta > T * log(u) with u in (0, 1] (the same draw as
+        # random.expovariate). Moves so much worse that exp(delta / T) < exp(-20)
+        # are rejected without a random draw.
         delta = neighbor_fitness - current_fitness
-        if delta > 0 or prng.random() < math.exp(delta / temperature):
-            current_solution = neighbor_solution
+        accepted = delta > 0 or (delta > -_REJECT_EXPONENT * temperature and
+                                 delta > temperature * math.log(1.0 - rand()))
+        if accepted:
+            current_solution[swap_index] = new_index
+            current_closest = neighbor_closest
             current_fitness = neighbor_fitness
             
             if current_fitness > best_fitness:
                 best_solution = current_solution[:]
                 best_fitness = current_fitness
+                iterations_since_improvement = 0
         
-        temperature *= cooling_rate
+        # Stagnation only counts once the search is frozen; while hot it is
+        # a random walk and the best solution is expected to stall
+        if delta < 0:
+            worsening_acceptance_rate += (accepted - worsening_acceptance_rate) * _LAM_RATE_SMOOTHING
+        if worsening_acceptance_rate < _FROZEN_ACCEPTANCE_RATE:
+            iterations_since_improvement += 1
+        
+        if schedule == 'self_tuning_lam':
+            acceptance_rate += (accepted - acceptance_rate) * _LAM_RATE_SMOOTHING
+            target_rate = _lam_target_acceptance(iteration / iterations)
+            temperature *= math.exp(_LAM_LEARNING_RATE * (target_rate - acceptance_rate))
+            temperature = max(temperature, min_temp)
+        else:
+            temperature *= cooling_rate
     
-    selected_colors = [colors[i] for i in best_solution]
-    return {
-        'colors': sort_colors(selected_colors),
-        'time': (time.time() - start_time) * 1000
-    }
+    return _selection_result(colors, best_solution, settings, start_time)
 
 
 def kmeans_plus_plus_selection(colors: List[Tuple[int, int, int]], select_count: int, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -438,48 +846,54 @@ def kmeans_plus_plus_selection(colors: List[Tuple[int, int, int]], select_count:
         settings = {}
     prng = random.Random(settings["seed"]) if "seed" in settings else random
     start_time = time.time()
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
-    
-    def min_distance_to_centers(point: int, centers: List[int]) -> float:
-        if not centers:
-            return float('inf')
-        return min(delta_e(lab_colors[point], lab_colors[center]) for center in centers)
+    lab_colors = _palette_to_lab(colors)
     
     # Select initial center randomly
     selected = [prng.randint(0, len(colors) - 1)]
     
+    # Squared distance from every color to its nearest center (k-means++
+    # weights), updated with the newest center only. Centers end up at 0.
+    distances = [float('inf')] * len(colors)
+    
     # Select remaining centers using k-means++ initialization
     while len(selected) < select_count:
-        distances = []
-        for i in range(len(colors)):
-            if i in selected:
-                distances.append(0)
-            else:
-                dist = min_distance_to_centers(i, selected)
-                distances.append(dist * dist)  # Square distances for k-means++
+        last_lab = lab_colors[selected[-1]]
+        distances = [current if current < distance else distance
+                     for current, lab in zip(distances, lab_colors)
+                     for distance in (delta_e_squared(lab, last_lab),)]
         
-        total = sum(distances)
+        # Roulette wheel over the weights: the first color whose cumulative
+        # weight exceeds the random value. Centers weigh 0 and are never hit.
+        cumulative = list(accumulate(distances))
+        total = cumulative[-1]
         if total == 0:
             # All remaining colors have zero distance, select randomly
-            available = [i for i in range(len(colors)) if i not in selected]
-            selected.append(prng.choice(available))
+            selected.append(_random_unselected(prng, len(colors), selected))
         else:
-            random_val = prng.random() * total
-            selected_index = 0
+            selected_index = bisect_right(cumulative, prng.random() * total)
             
-            while random_val > 0 and selected_index < len(distances):
-                if selected_index not in selected:
-                    random_val -= distances[selected_index]
-                if random_val > 0:
-                    selected_index += 1
+            # Rounding can leave the wheel past the end; step back to the
+            # last color with a non-zero weight
+            selected_index = min(selected_index, len(colors) - 1)
+            while distances[selected_index] == 0:
+                selected_index -= 1
             
             selected.append(selected_index)
     
-    selected_colors = [colors[i] for i in selected]
-    return {
-        'colors': sort_colors(selected_colors),
-        'time': (time.time() - start_time) * 1000
-    }
+    return _selection_result(colors, selected, settings, start_time, lab_colors)
+
+
+# Distance matrix of the palette in a genetic algorithm fitness worker process
+_worker_distances = None
+
+
+def _init_fitness_worker(distances) -> None:
+    global _worker_distances
+    _worker_distances = distances
+
+
+def _fitness_chunk(individuals: List[List[int]]) -> List[float]:
+    return [_min_pair_distance(individual, _worker_distances) for individual in individuals]
 
 
 def genetic_algorithm(colors: List[Tuple[int, int, int]], select_count: int, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -490,18 +904,20 @@ def genetic_algorithm(colors: List[Tuple[int, int, int]], select_count: int, set
         settings = {}
     prng = random.Random(settings["seed"]) if "seed" in settings else random
     start_time = time.time()
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
+    # Only minimum distances are compared, so squared distances suffice
+    distances = _selection_distances(colors, squared=True)
     population_size = settings.get('populationSize', 100)
     generations = settings.get('generations', 100)
     mutation_rate = settings.get('mutationRate', 0.1)
+    workers = settings.get('workers', 1)
     
-    def calculate_fitness(selection: List[int]) -> float:
-        min_dist = float('inf')
-        for i in range(len(selection) - 1):
-            for j in range(i + 1, len(selection)):
-                dist = delta_e(lab_colors[selection[i]], lab_colors[selection[j]])
-                min_dist = min(min_dist, dist)
-        return min_dist
+    def population_fitness(individuals: List[List[int]]) -> List[float]:
+        if executor is None:
+            return [_min_pair_distance(individual, distances) for individual in individuals]
+        # One chunk per worker keeps the inter-process traffic to a message each
+        chunk_size = -(-len(individuals) // workers)
+        chunks = [individuals[i:i + chunk_size] for i in range(0, len(individuals), chunk_size)]
+        return [fitness for chunk in executor.map(_fitness_chunk, chunks) for fitness in chunk]
     
     # Generate initial population
     population = []
@@ -509,61 +925,67 @@ def genetic_algorithm(colors: List[Tuple[int, int, int]], select_count: int, set
         individual = prng.sample(range(len(colors)), select_count)
         population.append(individual)
     
+    # The first generation's fitness pass scores every initial individual
     best_solution = population[0]
-    best_fitness = calculate_fitness(best_solution)
+    best_fitness = -float('inf')
     
-    # Main loop
-    for generation in range(generations):
-        # Calculate fitness for each solution
-        fitnesses = [calculate_fitness(individual) for individual in population]
-        
-        # Update best solution
-        max_fitness_index = fitnesses.index(max(fitnesses))
-        if fitnesses[max_fitness_index] > best_fitness:
-            best_solution = population[max_fitness_index][:]
-            best_fitness = fitnesses[max_fitness_index]
-        
-        # Create new population through selection and crossover
-        new_population = []
-        
-        while len(new_population) < population_size:
-            # Tournament selection
-            tournament1 = [prng.randint(0, population_size - 1) for _ in range(3)]
-            tournament2 = [prng.randint(0, population_size - 1) for _ in range(3)]
-            
-            parent1_idx = max(tournament1, key=lambda i: fitnesses[i])
-            parent2_idx = max(tournament2, key=lambda i: fitnesses[i])
-            
-            parent1 = population[parent1_idx]
-            parent2 = population[parent2_idx]
-            
-            # Crossover
-            crossover_point = prng.randint(0, select_count - 1)
-            child = list(set(parent1[:crossover_point] + parent2[crossover_point:]))
+    # Fitness can be spread over worker processes that each hold a copy of
+    # the distance matrix; only the individuals and their fitnesses are sent
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_fitness_worker,
+                                       initargs=(distances,))
+    
+    try:
+        # Main loop
+        for generation in range(generations):
+            # Calculate fitness for each solution
+            fitnesses = population_fitness(population)
             
-            # Fill up with random colors if needed
-            while len(child) < select_count:
-                available = [i for i in range(len(colors)) if i not in child]
-                child.append(prng.choice(available))
+            # Update best solution
+            max_fitness_index = fitnesses.index(max(fitnesses))
+            if fitnesses[max_fitness_index] > best_fitness:
+                best_solution = population[max_fitness_index][:]
+                best_fitness = fitnesses[max_fitness_index]
             
-            child = child[:select_count]  # Ensure exact size
+            # Create new population through selection and crossover
+            new_population = []
             
-            # Mutation
-            if prng.random() < mutation_rate:
-                mutation_index = prng.randint(0, select_count - 1)
-                available = [i for i in range(len(colors)) if i not in child]
-                if available:
-                    child[mutation_index] = prng.choice(available)
+            while len(new_population) < population_size:
+                # Tournament selection
+                tournament1 = prng.choices(range(population_size), k=3)
+                tournament2 = prng.choices(range(population_size), k=3)
+                
+                parent1_idx = max(tournament1, key=lambda i: fitnesses[i])
+                parent2_idx = max(tournament2, key=lambda i: fitnesses[i])
+                
+                parent1 = population[parent1_idx]
+                parent2 = population[parent2_idx]
+                
+                # Crossover; dict.fromkeys drops duplicates but keeps gene order
+                crossover_point = prng.randint(0, select_count - 1)
+                child = list(dict.fromkeys(parent1[:crossover_point] + parent2[crossover_point:]))
+                
+                # Fill up with random colors if needed; crossover rarely loses more
+                # than a gene or two, so draw them by rejection sampling
+                while len(child) < select_count:
+                    child.append(_random_unselected(prng, len(colors), child))
+                
+                # Mutation
+                if prng.random() < mutation_rate:
+                    mutation_index = prng.randint(0, select_count - 1)
+                    new_index = _random_unselected(prng, len(colors), child)
+                    if new_index is not None:
+                        child[mutation_index] = new_index
+                
+                new_population.append(child)
             
-            new_population.append(child)
-        
-        population = new_population
+            population = new_population
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
-    selected_colors = [colors[i] for i in best_solution]
-    return {
-        'colors': sort_colors(selected_colors),
-        'time': (time.time() - start_time) * 1000
-    }
+    return _selection_result(colors, best_solution, settings, start_time)
 
 
 def particle_swarm_optimization(colors: List[Tuple[int, int, int]], select_count: int, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -574,20 +996,15 @@ def particle_swarm_optimization(colors: List[Tuple[int, int, int]], select_count
         settings = {}
     prng = random.Random(settings["seed"]) if "seed" in settings else random
     start_time = time.time()
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
+    # Only minimum distances are compared, so squared distances suffice
+    distances = _selection_distances(colors, squared=True)
     num_particles = settings.get('numParticles', 30)
     max_iterations = settings.get('iterations', 100)
     w = settings.get('inertiaWeight', 0.7)
     c1 = settings.get('cognitiveWeight', 1.5)
     c2 = settings.get('socialWeight', 1.5)
     
-    def calculate_fitness(selection: List[int]) -> float:
-        min_dist = float('inf')
-        for i in range(len(selection) - 1):
-            for j in range(i + 1, len(selection)):
-                dist = delta_e(lab_colors[selection[i]], lab_colors[selection[j]])
-                min_dist = min(min_dist, dist)
-        return min_dist
+    rand = prng.random
     
     # Initialize particles
     particles = []
@@ -597,7 +1014,7 @@ def particle_swarm_optimization(colors: List[Tuple[int, int, int]], select_count
             'position': position,
             'velocity': [0] * select_count,
             'best_position': position[:],
-            'best_fitness': calculate_fitness(position)
+            'best_fitness': _min_pair_distance(position, distances)
         }
         particles.append(particle)
     
@@ -614,7 +1031,9 @@ def particle_swarm_optimization(colors: List[Tuple[int, int, int]], select_count
     for iteration in range(max_iterations):
         for particle in particles:
             # Calculate fitness
-            fitness = calculate_fitness(particle['position'])
+            # Only an improvement on the particle's best is of interest
+            fitness = _min_pair_distance_above(particle['position'], distances,
+                                               particle['best_fitness'])
             
             # Update particle's best
             if fitness > particle['best_fitness']:
@@ -628,20 +1047,13 @@ def particle_swarm_optimization(colors: List[Tuple[int, int, int]], select_count
             
             # Update velocity and position (simplified discrete version)
             for i in range(select_count):
-                r1 = prng.random()
-                r2 = prng.random()
-                
                 # Simplified velocity update for discrete space
-                if prng.random() < 0.5:  # Random component for exploration
-                    available = [j for j in range(len(colors)) if j not in particle['position']]
-                    if available:
-                        particle['position'][i] = prng.choice(available)
+                if rand() < 0.5:  # Random component for exploration
+                    new_index = _random_unselected(prng, len(colors), particle['position'])
+                    if new_index is not None:
+                        particle['position'][i] = new_index
     
-    selected_colors = [colors[i] for i in global_best_position]
-    return {
-        'colors': sort_colors(selected_colors),
-        'time': (time.time() - start_time) * 1000
-    }
+    return _selection_result(colors, global_best_position, settings, start_time)
 
 
 def ant_colony_optimization(colors: List[Tuple[int, int, int]], select_count: int, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -652,7 +1064,6 @@ def ant_colony_optimization(colors: List[Tuple[int, int, int]], select_count: in
         settings = {}
     prng = random.Random(settings["seed"]) if "seed" in settings else random
     start_time = time.time()
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
     num_ants = settings.get('numAnts', 20)
     max_iterations = settings.get('acoIterations', 100)
     evaporation_rate = settings.get('evaporationRate', 0.1)
@@ -662,13 +1073,9 @@ def ant_colony_optimization(colors: List[Tuple[int, int, int]], select_count: in
     # Initialize pheromone trails
     pheromones = [1.0] * len(colors)
     
-    # Calculate heuristic information (distances between colors)
-    distances = [[0.0] * len(colors) for _ in range(len(colors))]
-    for i in range(len(colors)):
-        for j in range(i + 1, len(colors)):
-            distance = delta_e(lab_colors[i], lab_colors[j])
-            distances[i][j] = distance
-            distances[j][i] = distance
+    # Heuristic information (distances between colors), shared with other
+    # algorithms run on the same palette
+    distances = _palette_distances(colors)
     
     best_solution = None
     best_fitness = -float('inf')
@@ -677,59 +1084,65 @@ def ant_colony_optimization(colors: List[Tuple[int, int, int]], select_count: in
     for iteration in range(max_iterations):
         solutions = []
         
+        # Pheromones only change between iterations
+        attraction = [pheromone ** alpha for pheromone in pheromones]
+        
         # Each ant constructs a solution
         for ant in range(num_ants):
-            available = list(range(len(colors)))
+            # taken[i] is True once color i is part of the solution
+            taken = [False] * len(colors)
+
             solution = []
             
             # Randomly select first color
-            first_index = prng.randint(0, len(available) - 1)
-            solution.append(available.pop(first_index))
+            first_index = prng.randint(0, len(colors) - 1)
+            solution.append(first_index)
+            taken[first_index] = True
+            
+            # Distance from every color to its nearest chosen color, updated
+            # with each pick
+
+            nearest = list(distances[first_index])
             
             # Select remaining colors
-            while len(solution) < select_count and available:
-                # Calculate probabilities for each available color
-                probabilities = []
-                for i in available:
-                    pheromone = pheromones[i] ** alpha
-                    min_dist = min(distances[i][j] for j in solution) if solution else 1
-                    heuristic = min_dist ** beta
-                    probabilities.append(pheromone * heuristic)
+            while len(solution) < select_count and len(solution) < len(colors):
+                # Weight of every color; chosen ones get zero
+                probabilities = [0.0 if chosen else weight * dist ** beta
+                                 for chosen, weight, dist in zip(taken, attraction, nearest)]
                 
-                # Select next color using roulette wheel selection
-                total = sum(probabilities)
+                # Select next color using roulette wheel selection: the first
+                # color whose cumulative weight exceeds the random value
+                cumulative = list(accumulate(probabilities))
+                total = cumulative[-1]
                 if total == 0:
-                    selected_index = prng.choice(available)
+                    selected_index = prng.choice([i for i in range(len(colors)) if not taken[i]])
                 else:
-                    random_val = prng.random() * total
-                    selected_index = 0
+                    selected_index = bisect_right(cumulative, prng.random() * total)
                     
-                    while random_val > 0 and selected_index < len(probabilities):
-                        random_val -= probabilities[selected_index]
-                        if random_val > 0:
-                            selected_index += 1
-                    
-                    selected_index = available[min(selected_index, len(available) - 1)]
+                    # Rounding can leave the wheel past the end; step back
+                    # to the last color with a non-zero weight
+                    selected_index = min(selected_index, len(colors) - 1)
+                    while probabilities[selected_index] == 0:
+                        selected_index -= 1
                 
                 solution.append(selected_index)
-                available.remove(selected_index)
+                taken[selected_index] = True
+                nearest = [dist if dist < other else other
+                           for dist, other in zip(nearest, distances[selected_index])]
             
             solutions.append(solution)
         
         # Evaluate solutions and update best
         for solution in solutions:
             if len(solution) == select_count:
-                fitness = min(delta_e(lab_colors[solution[i]], lab_colors[solution[j]])
-                            for i in range(len(solution) - 1)
-                            for j in range(i + 1, len(solution)))
+                fitness = _min_pair_distance_above(solution, distances, best_fitness)
                 
                 if fitness > best_fitness:
                     best_fitness = fitness
                     best_solution = solution
         
         # Update pheromones
-        for i in range(len(pheromones)):
-            pheromones[i] *= (1 - evaporation_rate)
+        pheromones = [pheromone * (1 - evaporation_rate) for pheromone in pheromones]
         
         # Add new pheromones from solutions
         for solution in solutions:
@@ -741,11 +1154,7 @@ def ant_colony_optimization(colors: List[Tuple[int, int, int]], select_count: in
     if best_solution is None:
         best_solution = prng.sample(range(len(colors)), select_count)
     
-    selected_colors = [colors[i] for i in best_solution]
-    return {
-        'colors': sort_colors(selected_colors),
-        'time': (time.time() - start_time) * 1000
-    }
+    return _selection_result(colors, best_solution, settings, start_time)
 
 
 def tabu_search(colors: List[Tuple[int, int, int]], select_count: int,
@@ -757,56 +1166,73 @@ def tabu_search(colors: List[Tuple[int, int, int]], select_count: int,
         settings = {}
     
     start_time = time.time()
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
+    # Only minimum distances are compared, so squared distances suffice
+    distances = _palette_distances(colors, squared=True)
     max_iterations = settings.get('maxIterations', 1000)
     tabu_tenure = settings.get('tabuTenure', 5)
     
-    def calculate_fitness(selection: List[int]) -> float:
-        min_dist = float('inf')
-        for i in range(len(selection) - 1):
-            for j in range(i + 1, len(selection)):
-                dist = delta_e(lab_colors[selection[i]], lab_colors[selection[j]])
-                min_dist = min(min_dist, dist)
-        return min_dist
-    
     # Initialize solution
     current = list(range(select_count))
     best = current[:]
-    best_fitness = calculate_fitness(best)
+    best_fitness = _min_pair_distance(best, distances)
     
-    # Tabu list implementation
+    # Tabu list implementation: move -> expiration iteration. A move old -> new
+    # is keyed by the int old * len(colors) + new. Expired moves are ignored at
+    # lookup and dropped in one pass once the list holds more than
+    # 8 * select_count moves.
+
     tabu_list = {}
     
-    def get_move_key(old_color: int, new_color: int) -> str:
-        return f"{old_color}-{new_color}"
-    
     for iteration in range(max_iterations):
-        best_neighbor_solution = None
+        best_move = None
         best_neighbor_fitness = -float('inf')
         
+        # Closest pair among the remaining colors when each slot is vacated;
+        # only the two slots of the current closest pair need a rescan
+        closest = _closest_pair(current, distances)
+        rest = [_closest_pair(current, distances, skip=i)[0] if i in closest[1:] else closest[0]
+                for i in range(select_count)]
+        
+        # Nearest and second-nearest selected color for every candidate, so a
+        # swap (i, j) is scored without rebuilding the neighbor
+        in_current = set(current)
+        candidates = []
+        for j in range(len(colors)):
+            if j not in in_current:
+                row = distances[j]
+                nearest = second = float('inf')
+                nearest_slot = -1
+                for slot, color in enumerate(current):
+                    dist = row[color]
+                    if dist < nearest:
+                        second = nearest
+                        nearest, nearest_slot = dist, slot
+                    elif dist < second:
+                        second = dist
+                candidates.append((j, nearest, nearest_slot, second))
+        
         # Examine all possible moves
         for i in range(select_count):
-            for j in range(len(colors)):
-                if j not in current:
-                    move_key = get_move_key(current[i], j)
-                    neighbor = current[:]
-                    neighbor[i] = j
-                    
-                    fitness = calculate_fitness(neighbor)
-                    
-                    # Accept if better than current best neighbor and not tabu
-                    # or if satisfies aspiration criterion (better than global best)
-                    if ((fitness > best_neighbor_fitness and 
-                         (move_key not in tabu_list or tabu_list[move_key] <= iteration)) or
-                        fitness > best_fitness):
-                        best_neighbor_solution = neighbor
-                        best_neighbor_fitness = fitness
+            rest_i = rest[i]
+            key_base = current[i] * len(colors)
+            for j, nearest, nearest_slot, second in candidates:
+                fitness = min(rest_i, second if nearest_slot == i else nearest)
+                
+                # Accept if better than current best neighbor and not tabu
+                # or if satisfies aspiration criterion (better than global best).
+                # The tabu list is only consulted for moves that would win.
+                if ((fitness > best_neighbor_fitness and
+                     tabu_list.get(key_base + j, iteration) <= iteration) or
+                    fitness > best_fitness):
+                    best_move = (i, j)
+                    best_neighbor_fitness = fitness
         
-        if best_neighbor_solution is None:
+        if best_move is None:
             break
         
         # Update current solution
-        current = best_neighbor_solution
+        current = current[:]
+        current[best_move[0]] = best_move[1]
         
         # Update best solution if improved
         if best_neighbor_fitness > best_fitness:
@@ -815,54 +1241,66 @@ def tabu_search(colors: List[Tuple[int, int, int]], select_count: int,
         
         # Update tabu list
         for i in range(select_count):
-            move_key = get_move_key(current[i], best[i])
+            move_key = current[i] * len(colors) + best[i]
             tabu_list[move_key] = iteration + tabu_tenure
         
-        # Clean expired tabu moves
-        expired_keys = [key for key, expiration in tabu_list.items() if expiration <= iteration]
-        for key in expired_keys:
-            del tabu_list[key]
+        # Clean expired tabu moves once they outnumber the live ones
+        if len(tabu_list) > 8 * select_count:
+            tabu_list = {key: expiration for key, expiration in tabu_list.items()
+                         if expiration > iteration}
     
-    selected_colors = [colors[i] for i in best]
-    return {
-        'colors': sort_colors(selected_colors),
-        'time': (time.time() - start_time) * 1000
-    }
+    return _selection_result(colors, best, settings, start_time)
 
 
 def exact_minimum(colors: List[Tuple[int, int, int]], select_count: int,
-                 _settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                 settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
-    Exact algorithm that tries all possible combinations to find the optimal solution.
+    Exact algorithm that finds the optimal solution by branch and bound.
+
+    Combinations are explored depth-first in lexicographic order. A color is
+    only considered for a partial selection while its distance to every color
+    already chosen beats the best minimum found so far, so whole branches are
+    pruned as soon as two colors are too close. The result is the same as
+    trying every combination.
     WARNING: This has exponential time complexity and should only be used for small datasets.
     """
     start_time = time.time()
-    lab_colors = [rgb_to_lab(rgb) for rgb in colors]
-    
-    def calculate_min_distance(selection: List[int]) -> float:
-        min_dist = float('inf')
-        for i in range(len(selection) - 1):
-            for j in range(i + 1, len(selection)):
-                dist = delta_e(lab_colors[selection[i]], lab_colors[selection[j]])
-                min_dist = min(min_dist, dist)
-        return min_dist
+    # Only minimum distances are compared, so squared distances suffice
+    distances = _palette_distances(colors, squared=True)
     
     best_selection = None
     best_min_distance = -float('inf')
+    selection = []
+    
+    def extend(candidates: List[Tuple[int, float]], min_distance: float, remaining: int) -> None:
+        # candidates: (color, distance to its nearest selected color), in index
+        # order, all after the last selected color
+        nonlocal best_min_distance, best_selection
+        for position, (color, nearest) in enumerate(candidates):
+            if len(candidates) - position < remaining:
+                break
+            new_min = min_distance if min_distance < nearest else nearest
+            if new_min <= best_min_distance:
+                continue
+            selection.append(color)
+            if remaining == 1:
+                best_min_distance = new_min
+                best_selection = selection[:]
+            else:
+                row = distances[color]
+                extend([(other, dist if dist < row[other] else row[other])
+                        for other, dist in candidates[position + 1:]
+                        if dist > best_min_distance and row[other] > best_min_distance],
+                       new_min, remaining - 1)
+            selection.pop()
+    
+    if select_count <= 0:
+        # The empty selection is the only one; extend() assumes at least one color
+        best_selection = []
+    else:
+        extend([(i, float('inf')) for i in range(len(colors))], float('inf'), select_count)
     
-    # Try all combinations
-    indices = list(range(len(colors)))
-    for selection in combinations(indices, select_count):
-        min_distance = calculate_min_distance(list(selection))
-        if min_distance > best_min_distance:
-            best_min_distance = min_distance
-            best_selection = list(selection)
-    
-    selected_colors = [colors[i] for i in best_selection]
-    return {
-        'colors': sort_colors(selected_colors),
-        'time': (time.time() - start_time) * 1000
-    }
+    return _selection_result(colors, best_selection, settings, start_time)
 
 
 # Convenience dictionary for algorithm access
@@ -891,14 +1329,17 @@ def generate_n_colors(n: int, algorithm: str = 'greedy',
     Args:
         n: Number of distinct colors to select
         algorithm: Algorithm to use for selection
-        settings: Optional algorithm-specific settings
+        settings: Optional algorithm-specific settings. If it contains 'seed',
+            the random pool is seeded too, making the whole call reproducible.
     
     Returns:
         Dictionary with 'colors' and 'time' keys
     """
+    prng = random.Random(settings["seed"]) if settings and "seed" in settings else random
+    
     # Generate n*10 random colors to select from
     pool_size = max(n * 10, 20)  # At least 20 colors in the pool
-    color_pool = generate_random_colors(pool_size)
+    color_pool = _random_color_pool(pool_size, prng)
     
     # Select the n most distinct colors
     return select_distinct_colors(color_pool, n, algorithm, settings)
@@ -912,7 +1353,9 @@ def select_distinct_colors(colors: List[Tuple[int, int, int]],
     Main function to select distinct colors using the specified algorithm.
     
     Args:
-        colors: List of RGB tuples [(r, g, b), ...]
+        colors: Sequence of RGB triples [(r, g, b), ...]; tuples, lists or any
+            other triple of integers are accepted and converted once to int
+            tuples. Anything else (RGBA, float channels) raises ValueError
         select_count: Number of colors to select
         algorithm: Algorithm name (see ALGORITHMS dict for options)
         settings: Optional algorithm-specific settings
@@ -923,12 +1366,56 @@ def select_distinct_colors(colors: List[Tuple[int, int, int]],
     if algorithm not in ALGORITHMS:
         raise ValueError(f"Unknown algorithm: {algorithm}. Available: {list(ALGORITHMS.keys())}")
     
+    colors = _normalize_colors(colors)
     if select_count > len(colors):
         raise ValueError("Cannot select more colors than available")
     
     return ALGORITHMS[algorithm](colors, select_count, settings)
 
 
+def select_distinct_colors_many(colors: List[Tuple[int, int, int]],
+                               select_count: int,
+                               runs: List[Any],
+                               max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run several algorithms (or settings of one algorithm) on the same palette, e.g. to compare them.
+    
+    The palette is validated and normalized once, and the cached LAB colors and
+    distance matrix are shared by every run.
+    
+    Args:
+        colors: Sequence of RGB triples [(r, g, b), ...]
+        select_count: Number of colors to select
+        runs: Algorithm names, or (algorithm, settings) pairs, e.g.
+            ['greedy', 'simulated_annealing', ('simulated_annealing', {'initialTemp': 2000})]
+        max_workers: If greater than 1, run the algorithms in parallel in a
+            pool of this many worker processes. Starting the pool costs tens
+            of milliseconds, so this only pays off for slow runs.
+    
+    Returns:
+        List of result dictionaries ('colors' and 'time' keys), one per run
+        and in the order of runs
+    """
+    runs = [(run, None) if isinstance(run, str) else tuple(run) for run in runs]
+    for algorithm, _ in runs:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}. Available: {list(ALGORITHMS.keys())}")
+    
+    colors = _normalize_colors(colors)
+    if select_count > len(colors):
+        raise ValueError("Cannot select more colors than available")
+    
+    if max_workers is not None and max_workers > 1:
+        # The algorithms are pure Python and hold the GIL, so use processes
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(ALGORITHMS[algorithm], colors, select_count, settings)
+                       for algorithm, settings in runs]
+            return [future.result() for future in futures]
+    
+    return [ALGORITHMS[algorithm](colors, select_count, settings)
+            for algorithm, settings in runs]
+
+
 def pick_distinct_colors(args=None, algorithm=None, pool_size=None, colors=None, options=None, seed=None):
     """
     Unified API for picking maximally distinct colors (matches JS version).
@@ -974,31 +1461,13 @@ def pick_distinct_colors(args=None, algorithm=None, pool_size=None, colors=None,
         _seed = seed if seed is not None else 42
     if count is None:
         raise ValueError('count is required')
+    if _algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {_algorithm}")
     # Prepare color pool
-    pool = _colors
+    pool = _normalize_colors(_colors) if _colors else []
     if not pool:
         size = _pool_size or max(count * 16, 128)
         random.seed(_seed)
         pool = generate_random_colors(size)
     # Call the correct algorithm
-    if _algorithm == 'max_sum_global':
-        return max_sum_distances_global(pool, count)
-    if _algorithm == 'max_sum_sequential':
-        return max_sum_distances_sequential(pool, count)
-    if _algorithm == 'greedy':
-        return greedy_selection(pool, count)
-    if _algorithm == 'kmeans_plus_plus':
-        return kmeans_plus_plus_selection(pool, count)
-    if _algorithm == 'simulated_annealing':
-        return simulated_annealing(pool, count, _options)
-    if _algorithm == 'genetic_algorithm':
-        return genetic_algorithm(pool, count, _options)
-    if _algorithm == 'particle_swarm':
-        return particle_swarm_optimization(pool, count, _options)
-    if _algorithm == 'ant_colony':
-        return ant_colony_optimization(pool, count, _options)
-    if _algorithm == 'tabu_search':
-        return tabu_search(pool, count, _options)
-    if _algorithm == 'exact_minimum':
-        return exact_minimum(pool, count)
-    raise ValueError(f"Unknown algorithm: {_algorithm}")
\ No newline at end of file
+    return ALGORITHMS[_algorithm](pool, count, _options)
\ No newline at end of file